@@ -187,6 +187,24 @@ function getUrlWeight(url) {
   return 1;
 }
 
+/**
+ * Drop signals that have aged out of the burst window, in place.
+ * Signals are appended in arrival order, so expired entries always form a
+ * prefix of the array: scan only until the first in-window signal and cut
+ * there, rather than re-testing every entry on each call.
+ * @param {Array<{timestamp: number, weight: number}>} signals
+ * @param {number} now
+ */
+function evictExpiredSignals(signals, now) {
+  let start = 0;
+  while (start < signals.length && now - signals[start].timestamp > BURST_WINDOW_MS) {
+    start++;
+  }
+  if (start > 0) {
+    signals.splice(0, start);
+  }
+}
+
 /**
  * Record an ad signal for a given tab with a weighted confidence value.
  * Uses burst detection: only triggers muting when enough weighted signals
@@ -199,19 +217,23 @@ function recordAdSignal(tabId, weight) {
   const now = Date.now();
   const existing = adState.get(tabId);
 
+  // Window totals are computed once here and shared by burst detection and
+  // the logging below. A brand-new state holds just this one signal.
+  let windowWeight = weight;
+  let signalCount = 1;
+  let burstDuration = 0;
+
   if (existing) {
     existing.lastSignal = now;
     existing.recentSignals.push({ timestamp: now, weight });
 
     // Evict signals older than the burst window
-    existing.recentSignals = existing.recentSignals.filter(
-      s => now - s.timestamp <= BURST_WINDOW_MS
-    );
+    evictExpiredSignals(existing.recentSignals, now);
 
-    const windowWeight = existing.recentSignals.reduce((sum, s) => sum + s.weight, 0);
-    const signalCount = existing.recentSignals.length;
+    windowWeight = existing.recentSignals.reduce((sum, s) => sum + s.weight, 0);
+    signalCount = existing.recentSignals.length;
     const isTier3Only = windowWeight === signalCount; // all signals are weight 1
-    const burstDuration = signalCount > 1
+    burstDuration = signalCount > 1
       ? now - existing.recentSignals[0].timestamp
       : 0;
 
@@ -258,13 +280,8 @@ function recordAdSignal(tabId, weight) {
   }
 
   const state = adState.get(tabId);
-  const windowWeight = state.recentSignals.reduce((sum, s) => sum + s.weight, 0);
-  const windowCount = state.recentSignals.length;
-  const windowDuration = windowCount > 1
-    ? now - state.recentSignals[0].timestamp
-    : 0;
   console.log(
-    `[Ad Detection] Signal for tab ${tabId} (+${weight}, weight: ${windowWeight}, count: ${windowCount}, duration: ${windowDuration}ms, phase: ${state.phase})`
+    `[Ad Detection] Signal for tab ${tabId} (+${weight}, weight: ${windowWeight}, count: ${signalCount}, duration: ${burstDuration}ms, phase: ${state.phase})`
   );
 
   // Auto-mute only when burst is confirmed (not during pending phase)
@@ -287,7 +304,7 @@ function recordAdSignal(tabId, weight) {
         autoMutedTabs.add(tabId);
         persistAutoMutedTabs();
         mutePending.delete(tabId);
-        console.log(`[Auto-Mute] Muted tab ${tabId} (weight: ${windowWeight}, count: ${windowCount})`);
+        console.log(`[Auto-Mute] Muted tab ${tabId} (weight: ${windowWeight}, count: ${signalCount})`);
         // Ensure tab is tracked in audioTabs for popup display
         if (!audioTabs.has(tabId)) {
           audioTabs.set(tabId, {
@@ -339,9 +356,7 @@ function checkAdStateExpiry() {
 
     if (state.phase === 'pending') {
       // Clean up pending entries whose burst window has emptied (no recent signals)
-      state.recentSignals = state.recentSignals.filter(
-        s => now - s.timestamp <= BURST_WINDOW_MS
-      );
+      evictExpiredSignals(state.recentSignals, now);
       if (state.recentSignals.length === 0) {
         adState.delete(tabId);
         console.log(`[Ad Detection] Pending state expired for tab ${tabId} (no burst detected)`);
@@ -391,6 +406,10 @@ function checkAdStateExpiry() {
 
 // --- webRequest listeners (top-level, observation-only, re-registered on every SW init) ---
 
+// Shared decoder for raw POST bodies. Non-streaming decode() keeps no state
+// between calls, so one instance serves every request.
+const requestBodyDecoder = new TextDecoder('utf-8');
+
 // Listen for request URLs and POST bodies
 chrome.webRequest.onBeforeRequest.addListener(
   (details) => {
@@ -408,10 +427,9 @@ chrome.webRequest.onBeforeRequest.addListener(
       // Check raw bytes (e.g., JSON payloads)
       if (details.requestBody.raw && details.requestBody.raw.length > 0) {
         try {
-          const decoder = new TextDecoder('utf-8');
           for (const element of details.requestBody.raw) {
             if (element.bytes) {
-              const bodyText = decoder.decode(element.bytes);
+              const bodyText = requestBodyDecoder.decode(element.bytes);
               const bodyWeight = getPatternWeight(bodyText);
               if (bodyWeight > weight) {
                 weight = bodyWeight;
@@ -76,6 +76,11 @@
     };
 
     function captureLog(level, args) {
+      // Bail out before serializing anything: addEntry would drop the entry
+      // anyway when not recording, and our own logs carry the tag up front
+      if (!diagnosticData.isRecording) return;
+      if (typeof args[0] === 'string' && args[0].includes('[Hush Tab Diagnostic]')) return;
+
       try {
         const message = Array.from(args).map(arg => {
           if (typeof arg === 'object') {
@@ -169,17 +174,20 @@
     console.log('[Hush Tab Diagnostic] Network capture initialized (PerformanceObserver)');
   }
 
+  // Substrings that mark a captured request as ad-related. Built once rather
+  // than per call: isAdRelatedUrl runs for every resource the page loads.
+  const AD_URL_PATTERNS = [
+    'doubleclick', 'googlesyndication', 'googleadservices', 'moatads',
+    '2mdn.net', 'imasdk', 'pubads', 'securepubads', 'fwmrm.net',
+    'uplynk', 'innovid', 'spotxchange', 'springserve', '/ads/',
+    '/ad/', 'adserver', 'ad-', '-ad', 'advertisement', 'pagead',
+    'adservice', 'tracking', 'beacon', 'analytics'
+  ];
+
   // Check if URL is ad-related
   function isAdRelatedUrl(url) {
-    const adPatterns = [
-      'doubleclick', 'googlesyndication', 'googleadservices', 'moatads',
-      '2mdn.net', 'imasdk', 'pubads', 'securepubads', 'fwmrm.net',
-      'uplynk', 'innovid', 'spotxchange', 'springserve', '/ads/',
-      '/ad/', 'adserver', 'ad-', '-ad', 'advertisement', 'pagead',
-      'adservice', 'tracking', 'beacon', 'analytics'
-    ];
     const lowerUrl = url.toLowerCase();
-    return adPatterns.some(pattern => lowerUrl.includes(pattern));
+    return AD_URL_PATTERNS.some(pattern => lowerUrl.includes(pattern));
   }
 
   // =========================================
@@ -224,6 +232,9 @@
       '[data-ad]', '[data-ad-state]', '.advertisement', '.commercial',
     ];
 
+    // Combined selector list so each subtree is walked once for all selectors
+    const interestingSelectorList = interestingSelectors.join(', ');
+
     // Test if a string contains ad-related patterns using word-boundary matching
     function containsAdPattern(str) {
       if (!str) return false;
@@ -283,10 +294,8 @@
 
       // Check if any interesting selector matches the target
       try {
-        for (const selector of interestingSelectors) {
-          if (target.matches?.(selector)) {
-            return true;
-          }
+        if (target.matches?.(interestingSelectorList)) {
+          return true;
         }
       } catch {
         // Ignore selector errors
@@ -323,19 +332,17 @@
               }
               // Also check children of added nodes for interesting elements
               try {
-                for (const selector of interestingSelectors) {
-                  const matches = node.querySelectorAll?.(selector);
-                  if (matches) {
-                    matches.forEach(match => {
-                      const matchInfo = describeElement(match);
-                      if (matchInfo.isInteresting) {
-                        summary.interestingElements.push({
-                          action: 'added (child)',
-                          ...matchInfo,
-                        });
-                      }
-                    });
-                  }
+                const matches = node.querySelectorAll?.(interestingSelectorList);
+                if (matches) {
+                  matches.forEach(match => {
+                    const matchInfo = describeElement(match);
+                    if (matchInfo.isInteresting) {
+                      summary.interestingElements.push({
+                        action: 'added (child)',
+                        ...matchInfo,
+                      });
+                    }
+                  });
                 }
               } catch {
                 // Ignore selector errors on detached nodes
@@ -367,11 +374,21 @@
               // Check both old and new values so we catch transitions in
               // both directions (gaining ad classes AND losing them).
               if (isInterestingClassChange(oldVal, newVal)) {
-                // Compute the actual diff for clearer output
-                const oldSet = new Set(oldVal.split(/\s+/).filter(Boolean));
-                const newSet = new Set(newVal.split(/\s+/).filter(Boolean));
-                const added = [...newSet].filter(c => !oldSet.has(c));
-                const removed = [...oldSet].filter(c => !newSet.has(c));
+                // Compute the actual diff for clearer output. Build the sets
+                // straight from the split and drop the empty token, then walk
+                // each set directly rather than copying it to an array first.
+                const oldSet = new Set(oldVal.split(/\s+/));
+                const newSet = new Set(newVal.split(/\s+/));
+                oldSet.delete('');
+                newSet.delete('');
+                const added = [];
+                for (const c of newSet) {
+                  if (!oldSet.has(c)) added.push(c);
+                }
+                const removed = [];
+                for (const c of oldSet) {
+                  if (!newSet.has(c)) removed.push(c);
+                }
 
                 summary.classChanges.push({
                   element: describeElement(target),
@@ -10,6 +10,9 @@ let currentTabId = null;
 let isRecording = false;
 let diagnosticData = null;
 let pollInterval = null;
+let activeViewerTab = 'console'; // matches the tab marked active in diagnostic.html
+// Analysis of the current snapshot, shared by the summary, export and copy actions
+let summaryCache = { data: null, summary: null };
 
 // DOM Elements
 const elements = {
@@ -135,6 +138,10 @@ function setupViewerTabs() {
 
       tab.classList.add('active');
       document.getElementById(`${targetTab}-viewer`).classList.add('active');
+
+      // Hidden panels are not re-rendered while polling, so catch up on show
+      activeViewerTab = targetTab;
+      if (diagnosticData) logViewRenderers[targetTab]?.();
     });
   });
 }
@@ -267,15 +274,21 @@ function updateStats() {
   elements.statAudio.textContent = diagnosticData.audioSignals?.length || 0;
 }
 
+// Log view renderers keyed by viewer tab name (the summary is rendered on stop)
+const logViewRenderers = {
+  console: refreshConsoleView,
+  network: refreshNetworkView,
+  dom: refreshDomView,
+  video: refreshVideoView,
+  player: refreshPlayerView,
+  audio: refreshAudioView,
+};
+
 function updateLogViews() {
   if (!diagnosticData) return;
 
-  refreshConsoleView();
-  refreshNetworkView();
-  refreshDomView();
-  refreshVideoView();
-  refreshPlayerView();
-  refreshAudioView();
+  // Only the visible panel is rebuilt on each poll; the rest render when shown
+  logViewRenderers[activeViewerTab]?.();
 }
 
 function clearLogContainers() {
@@ -402,9 +415,20 @@ function refreshVideoView() {
 function refreshPlayerView() {
   if (!diagnosticData?.playerState) return;
 
-  // Show only every 5th entry to reduce noise, unless there are few entries
+  // Show only every 5th entry (plus the latest) to reduce noise, unless there
+  // are few entries. Only the last 30 samples are rendered, so walk the sampled
+  // indices back from the end instead of filtering the whole history.
   const states = diagnosticData.playerState;
-  const filtered = states.length > 20 ? states.filter((_, i) => i % 5 === 0 || i === states.length - 1) : states;
+  let filtered = states;
+  if (states.length > 20) {
+    const last = states.length - 1;
+    filtered = [];
+    if (last % 5 !== 0) filtered.push(states[last]);
+    for (let i = last - (last % 5); i >= 0 && filtered.length < 30; i -= 5) {
+      filtered.push(states[i]);
+    }
+    filtered.reverse();
+  }
 
   elements.playerLogContainer.innerHTML = filtered.slice(-30).map(state => {
     let platformInfo = '';
@@ -463,16 +487,22 @@ function refreshPlayerView() {
   elements.playerLogContainer.scrollTop = elements.playerLogContainer.scrollHeight;
 }
 
+// CSS class per audio signal type (content-diagnostic.js emits a fixed set)
+const AUDIO_SIGNAL_CLASSES = {
+  VOLUME_CHANGED: 'log-audio-volume',
+  TIME_JUMP_BACKWARD: 'log-audio-time',
+  TIME_JUMP_FORWARD: 'log-audio-time',
+  TIME_STALLED: 'log-audio-time',
+  DURATION_CHANGED: 'log-audio-duration',
+  SOURCE_CHANGED: 'log-audio-source',
+};
+
 function refreshAudioView() {
   if (!diagnosticData?.audioSignals) return;
 
   elements.audioLogContainer.innerHTML = diagnosticData.audioSignals.slice(-100).map(signal => {
     // Color-code by signal type
-    let signalClass = 'log-audio';
-    if (signal.signal === 'VOLUME_CHANGED') signalClass = 'log-audio-volume';
-    else if (signal.signal.includes('TIME_')) signalClass = 'log-audio-time';
-    else if (signal.signal === 'DURATION_CHANGED') signalClass = 'log-audio-duration';
-    else if (signal.signal === 'SOURCE_CHANGED') signalClass = 'log-audio-source';
+    const signalClass = AUDIO_SIGNAL_CLASSES[signal.signal] || 'log-audio';
 
     let details = '';
     if (signal.signal === 'VOLUME_CHANGED') {
@@ -506,7 +536,7 @@ function generateSummary() {
     return;
   }
 
-  const summary = analyzeDiagnosticData(diagnosticData);
+  const summary = getDiagnosticSummary();
 
   elements.summaryContent.innerHTML = `
     <div class="summary-section">
@@ -521,7 +551,7 @@ function generateSummary() {
       ${summary.adNetworkRequests.length > 0 ? `
         <ul>
           ${summary.adNetworkRequests.slice(0, 20).map(req => `
-            <li><code>${escapeHtml(extractDomain(req.url))}</code> (${req.count}x)</li>
+            <li><code>${escapeHtml(req.url)}</code> (${req.count}x)</li>
           `).join('')}
         </ul>
       ` : '<p>No ad-related requests detected</p>'}
@@ -593,6 +623,14 @@ function generateSummary() {
   `;
 }
 
+// Analyze the current snapshot, reusing the previous result until a new one is fetched
+function getDiagnosticSummary() {
+  if (summaryCache.data !== diagnosticData) {
+    summaryCache = { data: diagnosticData, summary: analyzeDiagnosticData(diagnosticData) };
+  }
+  return summaryCache.summary;
+}
+
 function analyzeDiagnosticData(data) {
   const summary = {
     adNetworkRequests: [],
@@ -604,15 +642,14 @@ function analyzeDiagnosticData(data) {
   };
 
   // Analyze network requests
-  const adRequestCounts = {};
+  const adRequestCounts = new Map();
   data.networkRequests?.forEach(req => {
     if (req.isAdRelated) {
       const domain = extractDomain(req.url);
-      adRequestCounts[domain] = (adRequestCounts[domain] || 0) + 1;
+      adRequestCounts.set(domain, (adRequestCounts.get(domain) || 0) + 1);
     }
   });
-  summary.adNetworkRequests = Object.entries(adRequestCounts)
-    .map(([url, count]) => ({ url, count }))
+  summary.adNetworkRequests = Array.from(adRequestCounts, ([url, count]) => ({ url, count }))
     .sort((a, b) => b.count - a.count);
 
   // Find user markers
@@ -621,25 +658,38 @@ function analyzeDiagnosticData(data) {
   // Analyze player states for ad signals
   const adSignalsSet = new Set();
   data.playerState?.forEach(state => {
-    if (state.ytPlayer?.adShowing) adSignalsSet.add('YouTube: .ad-showing class detected');
-    if (state.ytPlayer?.adInterrupting) adSignalsSet.add('YouTube: .ad-interrupting class detected');
-    if (state.ytPlayer?.adModule) adSignalsSet.add('YouTube: .ytp-ad-module present');
-    if (state.ytPlayer?.skipButton) adSignalsSet.add('YouTube: Skip button detected');
-    if (state.ytPlayer?.adPreviewText) adSignalsSet.add(`YouTube: Ad preview text: "${state.ytPlayer.adPreviewText}"`);
-
-    if (state.huluPlayer?.adBreakMarker) adSignalsSet.add('Hulu: Ad break marker detected');
-    if (state.huluPlayer?.controlsDisabled) adSignalsSet.add('Hulu: Controls disabled during ad');
-    if (state.huluPlayer?.adCountdown) adSignalsSet.add(`Hulu: Countdown: "${state.huluPlayer.adCountdown}"`);
-
-    if (state.espnPlayer?.espnApiAdPlaying) adSignalsSet.add('ESPN: API reports ad playing');
-    if (state.espnPlayer?.imaContainer) adSignalsSet.add('ESPN: Google IMA container present');
-
-    if (state.nbcPlayer?.vjsAdPlaying) adSignalsSet.add('NBC: Video.js ad-playing state detected');
-    if (state.nbcPlayer?.isShortVideo) adSignalsSet.add(`NBC: Short video duration (${Math.round(state.nbcPlayer.videoDuration)}s) - likely ad`);
-    if (state.nbcPlayer?.adOverlay) adSignalsSet.add('NBC: Ad overlay/container visible');
-    if (state.nbcPlayer?.imaContainer) adSignalsSet.add('NBC: Google IMA container present');
-    if (state.nbcPlayer?.adTextFound) adSignalsSet.add(`NBC: Ad text detected: "${state.nbcPlayer.adTextFound}"`);
-    if (state.nbcPlayer?.seekDisabled) adSignalsSet.add('NBC: Seek bar disabled');
+    // Each state carries at most one platform block; skip the others outright
+    const yt = state.ytPlayer;
+    if (yt) {
+      if (yt.adShowing) adSignalsSet.add('YouTube: .ad-showing class detected');
+      if (yt.adInterrupting) adSignalsSet.add('YouTube: .ad-interrupting class detected');
+      if (yt.adModule) adSignalsSet.add('YouTube: .ytp-ad-module present');
+      if (yt.skipButton) adSignalsSet.add('YouTube: Skip button detected');
+      if (yt.adPreviewText) adSignalsSet.add(`YouTube: Ad preview text: "${yt.adPreviewText}"`);
+    }
+
+    const hulu = state.huluPlayer;
+    if (hulu) {
+      if (hulu.adBreakMarker) adSignalsSet.add('Hulu: Ad break marker detected');
+      if (hulu.controlsDisabled) adSignalsSet.add('Hulu: Controls disabled during ad');
+      if (hulu.adCountdown) adSignalsSet.add(`Hulu: Countdown: "${hulu.adCountdown}"`);
+    }
+
+    const espn = state.espnPlayer;
+    if (espn) {
+      if (espn.espnApiAdPlaying) adSignalsSet.add('ESPN: API reports ad playing');
+      if (espn.imaContainer) adSignalsSet.add('ESPN: Google IMA container present');
+    }
+
+    const nbc = state.nbcPlayer;
+    if (nbc) {
+      if (nbc.vjsAdPlaying) adSignalsSet.add('NBC: Video.js ad-playing state detected');
+      if (nbc.isShortVideo) adSignalsSet.add(`NBC: Short video duration (${Math.round(nbc.videoDuration)}s) - likely ad`);
+      if (nbc.adOverlay) adSignalsSet.add('NBC: Ad overlay/container visible');
+      if (nbc.imaContainer) adSignalsSet.add('NBC: Google IMA container present');
+      if (nbc.adTextFound) adSignalsSet.add(`NBC: Ad text detected: "${nbc.adTextFound}"`);
+      if (nbc.seekDisabled) adSignalsSet.add('NBC: Seek bar disabled');
+    }
   });
   summary.adSignals = Array.from(adSignalsSet).map(desc => ({ type: 'Player State', description: desc }));
 
@@ -677,7 +727,9 @@ function analyzeDiagnosticData(data) {
     mutation.classChanges?.forEach(change => {
       const classes = (change.newClasses || '').split(/\s+/);
       classes.forEach(cls => {
-        if (cls && (cls.toLowerCase().includes('ad') || cls.toLowerCase().includes('commercial'))) {
+        if (!cls) return;
+        const lower = cls.toLowerCase();
+        if (lower.includes('ad') || lower.includes('commercial')) {
           classesSet.add(cls);
         }
       });
@@ -716,7 +768,7 @@ function exportAsJson() {
   const exportData = {
     ...diagnosticData,
     exportedAt: new Date().toISOString(),
-    analysis: analyzeDiagnosticData(diagnosticData),
+    analysis: getDiagnosticSummary(),
   };
 
   const blob = new Blob([JSON.stringify(exportData, null, 2)], { type: 'application/json' });
@@ -734,7 +786,7 @@ function copySummary() {
     return;
   }
 
-  const summary = analyzeDiagnosticData(diagnosticData);
+  const summary = getDiagnosticSummary();
   let text = `Hush Tab Diagnostic Summary\n`;
   text += `===========================\n\n`;
   text += `Platform: ${diagnosticData.platform}\n`;